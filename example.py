@@ -13,9 +13,9 @@ gpu_info = GPUInfo()
 # Print detailed information about all detected GPUs
 gpu_info.print_gpu_info()
 
-# Get and display current GPU statistics
+# Get and display current GPU statistics, reusing the poll made by print_gpu_info if it is recent
 print("\nGetting current GPU stats:")
-current_stats = gpu_info.get_gpu_stats()
+current_stats = gpu_info.get_gpu_stats_cached()
 for stat in current_stats:
     print(f"GPU {stat.index} - Utilization: {stat.gpu_utilization}%, Memory Used: {stat.used_memory:.2f} GB")
 
@@ -6,22 +6,110 @@ It uses the pynvml library to interact with NVIDIA GPUs and can also check for P
 It also includes functionality to free up GPU resources.
 """
 
-import importlib
-from typing import List, Optional
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import importlib.util
+import logging
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 import os
 import subprocess
-from pydantic import BaseModel, Field
+import time
+import weakref
 import pynvml
 import psutil
 
 from .gpu_stat import GPUStat
 
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for get_gpu_stats_soa and get_gpu_stats_array
+    np = None
+
+
+logger = logging.getLogger(__name__)
 
 # Default list of processes exempt from termination
 DEFAULT_EXEMPT_PROCESSES = ["/usr/lib/xorg/Xorg", "/usr/bin/gnome-shell", "warp-terminal"]
 
+def _read_poll_interval(default: float = 1.0) -> float:
+    """
+    Read the GPU_POLL_INTERVAL_SECONDS environment variable.
 
-class GPUInfo(BaseModel):
+    Args:
+        default (float): The value used if the variable is unset or invalid.
+
+    Returns:
+        float: The configured poll interval in seconds.
+    """
+    value = os.environ.get("GPU_POLL_INTERVAL_SECONDS")
+    if value is None:
+        return default
+    try:
+        interval = float(value)
+    except ValueError:
+        interval = -1.0
+    if not interval >= 0:  # also rejects NaN
+        logger.warning("Ignoring invalid GPU_POLL_INTERVAL_SECONDS=%r, using %s", value, default)
+        return default
+    return interval
+
+# Default time-to-live of the statistics returned by get_gpu_stats_cached
+GPU_POLL_INTERVAL_SECONDS = _read_poll_interval()
+
+# Upper bound on the number of threads used to poll GPUs concurrently
+_MAX_POLL_WORKERS = 16
+
+# Upper bounds of plausible samples; NVML occasionally reports values beyond them
+_MAX_UTILIZATION = 100
+_MAX_TEMPERATURE = 150  # in Celsius
+
+# Conversion factor from bytes to GB, so byte counts are scaled with a multiplication
+_INV_GIB = 1.0 / (1 << 30)
+
+# GPUStat fields that change at runtime and are polled on every refresh, in GPUStat field order
+_DYNAMIC_FIELDS = ("used_memory", "free_memory", "temperature", "gpu_utilization", "memory_utilization", "fan_speed", "sm_clock",
+                   "decoder_utilization", "encoder_utilization", "jpeg_utilization")
+
+# Capability bits of the per-GPU NVML queries. Not every GPU supports every query
+# (e.g. fanless datacenter GPUs, MIG slices, vGPUs), so support is probed once per GPU
+# and unsupported queries are skipped during polling instead of raising.
+_CAP_MEMORY = 1 << 0
+_CAP_CLOCK = 1 << 1
+_CAP_UTILIZATION = 1 << 2
+_CAP_DECODER = 1 << 3
+_CAP_ENCODER = 1 << 4
+_CAP_JPEG = 1 << 5
+_CAP_TEMPERATURE = 1 << 6
+_CAP_FAN = 1 << 7
+
+# Capabilities whose queries only fill optional GPUStat fields. If such a query keeps
+# failing while probing, the field is reported as unavailable instead of failing initialization.
+_OPTIONAL_CAPS = _CAP_CLOCK | _CAP_DECODER | _CAP_ENCODER | _CAP_JPEG | _CAP_FAN
+
+# Name and query of each capability bit, in polling order. The clock query must precede the
+# utilization query: under WSL2 the NVML shim returns NVML_ERROR_UNKNOWN for utilization
+# unless a clock or power query came first.
+_CAPABILITY_PROBES = (
+    (_CAP_MEMORY, "memory", lambda handle: pynvml.nvmlDeviceGetMemoryInfo(handle)),
+    (_CAP_CLOCK, "sm_clock", lambda handle: pynvml.nvmlDeviceGetClockInfo(handle, pynvml.NVML_CLOCK_SM)),
+    (_CAP_UTILIZATION, "utilization", lambda handle: pynvml.nvmlDeviceGetUtilizationRates(handle)),
+    (_CAP_DECODER, "decoder_utilization", lambda handle: pynvml.nvmlDeviceGetDecoderUtilization(handle)),
+    (_CAP_ENCODER, "encoder_utilization", lambda handle: pynvml.nvmlDeviceGetEncoderUtilization(handle)),
+    # nvmlDeviceGetJpgUtilization is only available in newer pynvml versions
+    (_CAP_JPEG, "jpeg_utilization", (lambda handle: pynvml.nvmlDeviceGetJpgUtilization(handle))
+                                    if hasattr(pynvml, "nvmlDeviceGetJpgUtilization") else None),
+    (_CAP_TEMPERATURE, "temperature", lambda handle: pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU)),
+    (_CAP_FAN, "fan_speed", lambda handle: pynvml.nvmlDeviceGetFanSpeed(handle)),
+)
+
+# Record layout of get_gpu_stats_array: the index and total memory followed by the dynamic fields
+_GPU_DTYPE = None
+if np is not None:
+    _GPU_DTYPE = np.dtype([("index", "i4"), ("total_memory", "f4")] + [(field, "f4") for field in _DYNAMIC_FIELDS])
+
+
+class GPUInfo:
     """
     A class to represent information about available GPUs and manage GPU resources.
 
@@ -31,113 +119,468 @@ class GPUInfo(BaseModel):
     Attributes:
         gpu_count (int): The number of GPUs detected.
         gpus (List[GPUStat]): A list of GPUStat objects containing information about each GPU.
-        torch_available (bool): Whether PyTorch is installed.
-        torch_cuda_available (bool): Whether CUDA is available for PyTorch.
+                              Reused for GPU_POLL_INTERVAL_SECONDS, starting with the values read at initialization.
+        strict_util (bool): Whether out-of-range samples are replaced by the previous value instead of clamped.
+        torch_available (bool): Whether PyTorch is installed. Checked on first access.
+        torch_cuda_available (bool): Whether CUDA is available for PyTorch. Checked on first access.
     """
-    
-    gpu_count: int = 0
-    gpus: List[GPUStat] = []
-    torch_available: bool = False
-    torch_cuda_available: bool = False
 
-    def __init__(self, **data):
+    gpu_count: int
+    strict_util: bool
+
+    # NVML is initialized once per process and shut down at interpreter exit
+    _nvml_initialized: ClassVar[bool] = False
+
+    def __init__(self, strict_util: bool = False):
         """
         Initialize the GPUInfo object and gather initial GPU information.
+
+        Args:
+            strict_util (bool): Whether to drop out-of-range utilization and temperature samples
+                                and reuse the previous value instead of clamping them. Defaults to False.
         """
-        super().__init__(**data)
+        self.gpu_count = 0
+        self.strict_util = strict_util
+        # NVML device handles, stable for the lifetime of the NVML session
+        self._handles: Tuple[Any, ...] = ()
+        # Per-device fields that do not change at runtime, as (index, name, total_memory) tuples
+        self._static_info: List[tuple] = []
+        # Bitmask of the _CAP_* queries supported by each GPU
+        self._caps: List[int] = []
+        # Most recent result of get_gpu_stats, reused by get_gpu_stats_cached
+        self._last_stats: List[GPUStat] = []
+        self._last_poll_ts = float("-inf")
+        # Thread pool polling multi-GPU systems, created on first use
+        self._executor: Optional[ThreadPoolExecutor] = None
         self.initialize_gpu_info()
 
+    @staticmethod
+    def _ensure_nvml():
+        """
+        Initialize NVML on first use and register its shutdown at interpreter exit.
+
+        Subsequent calls are no-ops, so the NVML session is shared by all GPUInfo instances.
+        """
+        if not GPUInfo._nvml_initialized:
+            pynvml.nvmlInit()
+            atexit.register(GPUInfo._shutdown_nvml)
+            GPUInfo._nvml_initialized = True
+
+    @staticmethod
+    def _shutdown_nvml():
+        """
+        Shut down the shared NVML session, if it was initialized.
+        """
+        if GPUInfo._nvml_initialized:
+            try:
+                pynvml.nvmlShutdown()
+            except pynvml.NVMLError:
+                pass
+            GPUInfo._nvml_initialized = False
+
     def initialize_gpu_info(self):
         """
-        Initialize GPU information by detecting GPUs and checking PyTorch availability.
+        Initialize GPU information by detecting GPUs.
+
+        NVML is initialized only once per process. The static information (count, handles,
+        names, total memory and capabilities) is gathered here. The queries issued to probe
+        the capabilities double as the first poll of the dynamic statistics, so the first
+        access to gpus within GPU_POLL_INTERVAL_SECONDS does not query the GPUs again.
         """
         try:
-            pynvml.nvmlInit()
-            self.gpu_count = pynvml.nvmlDeviceGetCount()
-            self.gpus = self.get_gpu_stats()
+            self._ensure_nvml()
+            gpu_count = pynvml.nvmlDeviceGetCount()
+            handles = tuple(pynvml.nvmlDeviceGetHandleByIndex(i) for i in range(gpu_count))
+            probes = [self._probe_capabilities(i, handle) for i, handle in enumerate(handles)]
+            probed_at = time.monotonic()
+            caps = [device_caps for device_caps, _ in probes]
+            static_info = [self._query_static_info(i, handle, results.get(_CAP_MEMORY))
+                           for i, (handle, (_, results)) in enumerate(zip(handles, probes))]
         except pynvml.NVMLError as error:
             print(f"Error initializing NVML: {error}")
             print("NVIDIA GPUs may not be present or the NVIDIA driver may not be installed.")
-        finally:
+            return
+
+        # Only publish the GPU information once all of it was gathered, so it stays consistent
+        self.gpu_count = gpu_count
+        self._handles = handles
+        self._caps = caps
+        self._static_info = static_info
+        # Statistics polled before a re-initialization may belong to a different set of GPUs,
+        # so they are cleared before _sanitize gets to reuse any of their samples
+        self._last_stats = []
+        self._last_stats = [GPUStat(*info, *self._to_dynamic_info(i, results))
+                            for i, (info, (_, results)) in enumerate(zip(static_info, probes))]
+        self._last_poll_ts = probed_at
+
+    @staticmethod
+    def _query_static_info(index: int, handle, memory_info) -> tuple:
+        """
+        Query the fields of a GPU that stay constant for the lifetime of the NVML session.
+
+        Args:
+            index (int): The index of the GPU.
+            handle: The NVML device handle of the GPU.
+            memory_info: The memory information obtained while probing the GPU, or None if unsupported.
+
+        Returns:
+            tuple: The index, name and total memory (in GB, NaN if unavailable) of the GPU.
+        """
+        name = pynvml.nvmlDeviceGetName(handle)
+        if isinstance(name, bytes):
+            name = name.decode('utf-8') # fix for older pynvml versions
+        total_memory = memory_info.total * _INV_GIB if memory_info is not None else float("nan")
+        return (index, name, total_memory)
+
+    @classmethod
+    def _probe_capabilities(cls, index: int, handle) -> Tuple[int, Dict[int, Any]]:
+        """
+        Determine which of the NVML queries used for polling a GPU supports.
+
+        An optional query that keeps failing is logged and treated as unsupported,
+        so a single misbehaving optional field does not hide the whole GPU.
+
+        Args:
+            index (int): The index of the GPU.
+            handle: The NVML device handle of the GPU.
+
+        Returns:
+            Tuple[int, Dict[int, Any]]: A bitmask of the supported _CAP_* queries, and the
+                                        results of the supported queries keyed by capability bit.
+
+        Raises:
+            pynvml.NVMLError: If a query of a required field keeps failing.
+        """
+        caps = 0
+        results = {}
+        for cap, name, query in _CAPABILITY_PROBES:
+            if query is None:
+                continue
             try:
-                pynvml.nvmlShutdown()
-            except:
-                pass
+                result = cls._probe(query, handle)
+            except pynvml.NVMLError as error:
+                if not cap & _OPTIONAL_CAPS:
+                    raise
+                logger.warning("Disabling %s of GPU %d after repeated NVML errors: %s", name, index, error)
+                result = None
+            if result is not None:
+                caps |= cap
+                results[cap] = result
+        return caps, results
+
+    @staticmethod
+    def _probe(query, handle):
+        """
+        Check whether a GPU supports an NVML query, e.g. the fan speed of a fanless datacenter GPU.
 
-        self.check_torch_availability()
+        Only errors stating that the query is unsupported mark it as such. Any other
+        NVML error is considered transient: the query is retried once and the error is
+        re-raised if it persists, rather than disabling the query for good.
+
+        Args:
+            query: The NVML device query function.
+            handle: The NVML device handle of the GPU.
+
+        Returns:
+            The result of the query, or None if it is unsupported.
+
+        Raises:
+            pynvml.NVMLError: If the query fails twice for a reason other than lack of support.
+        """
+        for attempt in range(2):
+            try:
+                return query(handle)
+            except (pynvml.NVMLError_NotSupported, pynvml.NVMLError_NoPermission, pynvml.NVMLError_FunctionNotFound):
+                return None
+            except pynvml.NVMLError:
+                if attempt:
+                    raise
+
+    @property
+    def gpus(self) -> List[GPUStat]:
+        """
+        Statistics for all detected GPUs, reused for GPU_POLL_INTERVAL_SECONDS after each poll.
+        """
+        return self.get_gpu_stats_cached()
 
     def get_gpu_stats(self) -> List[GPUStat]:
         """
         Retrieve current statistics for all detected GPUs.
 
+        Only the dynamic fields are polled; the index, name and total memory are taken
+        from the static information cached in initialize_gpu_info. On multi-GPU systems
+        the GPUs are polled concurrently.
+
+        Returns:
+            List[GPUStat]: A list of GPUStat objects containing information about each GPU.
+        """
+        self._last_stats = self._map_devices(self._poll_single)
+        self._last_poll_ts = time.monotonic()
+        return list(self._last_stats)
+
+    def get_gpu_stats_cached(self, ttl: Optional[float] = None) -> List[GPUStat]:
+        """
+        Retrieve statistics for all detected GPUs, reusing the last poll if it is recent enough.
+
+        A new list is returned on every call, so modifying it does not affect the cache.
+
+        Args:
+            ttl (Optional[float]): Maximum age in seconds of the cached statistics.
+                                   Defaults to GPU_POLL_INTERVAL_SECONDS, which can be set
+                                   through the environment variable of the same name.
+
         Returns:
             List[GPUStat]: A list of GPUStat objects containing information about each GPU.
         """
-        gpu_stats = []
+        if ttl is None:
+            ttl = GPU_POLL_INTERVAL_SECONDS
+        if time.monotonic() - self._last_poll_ts < ttl:
+            return list(self._last_stats)
+        return self.get_gpu_stats()
+
+    def get_gpu_stats_soa(self) -> Dict[str, "np.ndarray"]:
+        """
+        Retrieve current statistics for all detected GPUs as parallel NumPy arrays.
+
+        Element i of every array belongs to GPU i. Unavailable values (e.g. the fan speed
+        of a GPU without a fan) are stored as NaN. This avoids creating a GPUStat object
+        per GPU and allows vectorized processing of the statistics.
+
+        Returns:
+            Dict[str, np.ndarray]: A float32 array per dynamic field, keyed by GPUStat field name.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        _require_numpy("get_gpu_stats_soa")
+
+        stats = {field: np.full(len(self._handles), np.nan, dtype=np.float32) for field in _DYNAMIC_FIELDS}
+        for i, dynamic_info in enumerate(self._map_devices(self._poll_dynamic_info)):
+            for field, value in zip(_DYNAMIC_FIELDS, dynamic_info):
+                stats[field][i] = np.nan if value is None else value
+        return stats
+
+    def get_gpu_stats_array(self) -> "np.ndarray":
+        """
+        Retrieve current statistics for all detected GPUs as a NumPy structured array.
+
+        Each record holds the index and total memory of a GPU followed by its dynamic
+        GPUStat fields. Unavailable values are stored as NaN. The array is a single
+        contiguous buffer, so exporters can copy it without touching individual fields.
+
+        Returns:
+            np.ndarray: An array with one record per GPU, using the _GPU_DTYPE layout.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        _require_numpy("get_gpu_stats_array")
+
+        stats = np.empty(len(self._handles), dtype=_GPU_DTYPE)
+        for i, dynamic_info in enumerate(self._map_devices(self._poll_dynamic_info)):
+            index, _, total_memory = self._static_info[i]
+            stats[i] = (index, total_memory, *(np.nan if value is None else value for value in dynamic_info))
+        return stats
+
+    def _map_devices(self, func) -> list:
+        """
+        Apply a polling function to every GPU, using a thread pool when more than one GPU is present.
+
+        NVML is thread-safe once initialized and its calls release the GIL,
+        so the per-GPU queries can run concurrently. The thread pool is reused
+        across polls, so its threads are not started anew on every call.
+
+        Args:
+            func: The function to call with the index of each GPU.
+
+        Returns:
+            list: The results of func, in GPU index order.
+        """
+        indices = range(len(self._handles))
+        if len(indices) <= 1:
+            return list(map(func, indices))
+        if self._executor is None:
+            # Threads are only started as needed, up to one per GPU
+            self._executor = ThreadPoolExecutor(max_workers=_MAX_POLL_WORKERS, thread_name_prefix="gpuinfo")
+            weakref.finalize(self, self._executor.shutdown, wait=False)
+        return list(self._executor.map(func, indices))
+
+    def _poll_single(self, index: int) -> GPUStat:
+        """
+        Poll the current statistics of a single GPU.
+
+        Args:
+            index (int): The index of the GPU.
+
+        Returns:
+            GPUStat: The current statistics of the GPU.
+        """
+        return GPUStat(*self._static_info[index], *self._poll_dynamic_info(index))
+
+    def _poll_dynamic_info(self, index: int) -> tuple:
+        """
+        Poll the fields of a GPU that change at runtime.
+
+        Only the queries the GPU supports according to its capability bitmask are issued,
+        in the order of _CAPABILITY_PROBES.
+
+        Args:
+            index (int): The index of the GPU.
+
+        Returns:
+            tuple: The current values of the dynamic GPUStat fields, in the order of _DYNAMIC_FIELDS.
+        """
+        handle = self._handles[index]
+        caps = self._caps[index]
+        results = {}
+        for cap, _, query in _CAPABILITY_PROBES:
+            if caps & cap:
+                results[cap] = self._query_optional(query, handle) if cap & _OPTIONAL_CAPS else query(handle)
+        return self._to_dynamic_info(index, results)
+
+    def _to_dynamic_info(self, index: int, results: Dict[int, Any]) -> tuple:
+        """
+        Convert the raw results of the NVML queries of a GPU into its dynamic fields.
+
+        Unavailable optional fields are None, unavailable required fields are NaN.
+
+        Args:
+            index (int): The index of the GPU.
+            results (Dict[int, Any]): The results of the queries, keyed by capability bit.
+                                      Unsupported or failed queries are missing or None.
+
+        Returns:
+            tuple: The values of the dynamic GPUStat fields, in the order of _DYNAMIC_FIELDS.
+        """
+        nan = float("nan")
+
+        memory_info = results.get(_CAP_MEMORY)
+        if memory_info is not None:
+            used_memory = memory_info.used * _INV_GIB
+            free_memory = memory_info.free * _INV_GIB
+        else:
+            used_memory = free_memory = nan
+        utilization = results.get(_CAP_UTILIZATION)
+        if utilization is not None:
+            gpu_utilization = self._sanitize(index, "gpu_utilization", utilization.gpu, _MAX_UTILIZATION)
+            memory_utilization = self._sanitize(index, "memory_utilization", utilization.memory, _MAX_UTILIZATION)
+        else:
+            gpu_utilization = memory_utilization = nan
+        # The engine queries return the utilization together with its sampling period
+        engine_utilization = []
+        for cap, field in ((_CAP_DECODER, "decoder_utilization"), (_CAP_ENCODER, "encoder_utilization"), (_CAP_JPEG, "jpeg_utilization")):
+            sample = results.get(cap)
+            engine_utilization.append(None if sample is None else self._sanitize(index, field, sample[0], _MAX_UTILIZATION))
+        temperature = results.get(_CAP_TEMPERATURE)
+        temperature = nan if temperature is None else self._sanitize(index, "temperature", temperature, _MAX_TEMPERATURE)
+
+        return (
+            used_memory,
+            free_memory,
+            temperature,
+            gpu_utilization,
+            memory_utilization,
+            results.get(_CAP_FAN),
+            results.get(_CAP_CLOCK),
+            *engine_utilization,
+        )
+
+    @staticmethod
+    def _query_optional(query, handle):
+        """
+        Issue the NVML query of an optional GPUStat field.
+
+        The GPU supports the query according to its capability bitmask, so an error
+        is a transient failure and the field is reported as unavailable for this poll.
+
+        Args:
+            query: The NVML device query function.
+            handle: The NVML device handle of the GPU.
+
+        Returns:
+            The result of the query, or None if it failed.
+        """
         try:
-            pynvml.nvmlInit()
-            for i in range(self.gpu_count):
-                handle = pynvml.nvmlDeviceGetHandleByIndex(i)
-                name = pynvml.nvmlDeviceGetName(handle)
-                if isinstance(name, bytes):
-                    name = name.decode('utf-8') # fix for older pynvml versions
-                memory_info = pynvml.nvmlDeviceGetMemoryInfo(handle)
-                utilization = pynvml.nvmlDeviceGetUtilizationRates(handle)
-                temperature = pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU)
-                try:
-                    fan_speed = pynvml.nvmlDeviceGetFanSpeed(handle)
-                except pynvml.NVMLError:
-                    fan_speed = None
-
-                gpu_stats.append(GPUStat(
-                    index=i,
-                    name=name,
-                    total_memory=memory_info.total / 1024**3,
-                    used_memory=memory_info.used / 1024**3,
-                    free_memory=memory_info.free / 1024**3,
-                    temperature=temperature,
-                    gpu_utilization=utilization.gpu,
-                    memory_utilization=utilization.memory,
-                    fan_speed=fan_speed
-                ))
-        finally:
-            try:
-                pynvml.nvmlShutdown()
-            except:
-                pass
-        return gpu_stats
+            return query(handle)
+        except pynvml.NVMLError:
+            return None
 
-    def check_torch_availability(self):
+    def _sanitize(self, index: int, field: str, value, upper: float):
         """
-        Check if PyTorch is installed and if CUDA is available for PyTorch.
+        Bring a polled sample that lies outside [0, upper] back into range.
+
+        The sample is clamped, or, if strict_util is set, replaced by the value of the
+        previous get_gpu_stats poll when one is available.
+
+        Args:
+            index (int): The index of the GPU.
+            field (str): The GPUStat field the sample belongs to.
+            value: The polled sample, or None if unavailable.
+            upper (float): The largest plausible value of the sample.
+
+        Returns:
+            The sample if it is in range, otherwise its replacement.
         """
-        torch_spec = importlib.util.find_spec("torch")
-        if torch_spec is not None:
-            import torch
-            self.torch_available = True
-            self.torch_cuda_available = torch.cuda.is_available()
+        if value is None or 0 <= value <= upper:
+            return value
+        logger.debug("GPU %d reported out-of-range %s: %s", index, field, value)
+        if self.strict_util and index < len(self._last_stats):
+            previous = getattr(self._last_stats[index], field)
+            if previous is not None:
+                return previous
+        return min(max(value, 0), upper)
+
+    @functools.cached_property
+    def torch_available(self) -> bool:
+        """
+        Whether PyTorch is installed.
+        """
+        return importlib.util.find_spec("torch") is not None
+
+    @functools.cached_property
+    def torch_cuda_available(self) -> bool:
+        """
+        Whether CUDA is available for PyTorch.
+
+        PyTorch is only imported on first access, so users who only read GPU
+        statistics never pay for importing it.
+        """
+        if not self.torch_available:
+            return False
+        import torch
+        return torch.cuda.is_available()
 
     def print_gpu_info(self):
         """
         Print detailed information about all detected GPUs and PyTorch availability.
         """
-        print(f"Number of GPUs detected: {self.gpu_count}")
+        lines = [f"Number of GPUs detected: {self.gpu_count}"]
         for gpu in self.gpus:
-            print(f"\nGPU {gpu.index}:")
-            print(f"  Name: {gpu.name}")
-            print(f"  Total memory: {gpu.total_memory:.2f} GB")
-            print(f"  Used memory: {gpu.used_memory:.2f} GB")
-            print(f"  Free memory: {gpu.free_memory:.2f} GB")
-            print(f"  GPU Utilization: {gpu.gpu_utilization}%")
-            print(f"  Memory Utilization: {gpu.memory_utilization}%")
-            print(f"  Temperature: {gpu.temperature}°C")
+            lines.append(f"\nGPU {gpu.index}:")
+            lines.append(f"  Name: {gpu.name}")
+            lines.append(f"  Total memory: {gpu.total_memory:.2f} GB")
+            lines.append(f"  Used memory: {gpu.used_memory:.2f} GB")
+            lines.append(f"  Free memory: {gpu.free_memory:.2f} GB")
+            lines.append(f"  GPU Utilization: {gpu.gpu_utilization}%")
+            lines.append(f"  Memory Utilization: {gpu.memory_utilization}%")
+            lines.append(f"  Temperature: {gpu.temperature}°C")
             if gpu.fan_speed is not None:
-                print(f"  Fan Speed: {gpu.fan_speed}%")
+                lines.append(f"  Fan Speed: {gpu.fan_speed}%")
             else:
-                print("  Fan Speed: N/A")
+                lines.append("  Fan Speed: N/A")
+            if gpu.sm_clock is not None:
+                lines.append(f"  SM Clock: {gpu.sm_clock} MHz")
+            else:
+                lines.append("  SM Clock: N/A")
+            for label, value in (("Decoder", gpu.decoder_utilization),
+                                 ("Encoder", gpu.encoder_utilization),
+                                 ("JPEG", gpu.jpeg_utilization)):
+                lines.append(f"  {label} Utilization: {value}%" if value is not None else f"  {label} Utilization: N/A")
 
-        print(f"\nPyTorch installed: {self.torch_available}")
-        print(f"PyTorch CUDA available: {self.torch_cuda_available}")
+        lines.append(f"\nPyTorch installed: {self.torch_available}")
+        lines.append(f"PyTorch CUDA available: {self.torch_cuda_available}")
+        # A single write keeps the report together when other threads print concurrently
+        print("\n".join(lines))
 
     def _terminate_gpu_processes(self, gpu_index: int, exempt_processes: List[str]):
         """
@@ -152,24 +595,49 @@ class GPUInfo(BaseModel):
             It may not be able to terminate all processes, especially those started by other users.
         """
         try:
-            result = subprocess.run(['nvidia-smi', '--query-compute-apps=pid', '--format=csv,noheader,nounits', f'--id={gpu_index}'], 
+            pids = self._get_gpu_pids(gpu_index)
+        except (pynvml.NVMLError, subprocess.CalledProcessError, FileNotFoundError) as e:
+            print(f"Error querying processes on GPU {gpu_index}: {e}")
+            return
+
+        exempt = set(exempt_processes)
+        # Only the handful of GPU processes are looked up, instead of scanning every process on the host
+        for pid in dict.fromkeys(pids):
+            try:
+                process = psutil.Process(pid)
+                name = process.name()
+                if name not in exempt:
+                    process.terminate()
+                    print(f"Terminated process {pid} ({name})")
+                else:
+                    print(f"Skipped termination of exempt process {pid} ({name})")
+            except psutil.NoSuchProcess:
+                print(f"Process {pid} not found")
+            except psutil.AccessDenied:
+                print(f"Permission denied to terminate process {pid}")
+
+    def _get_gpu_pids(self, gpu_index: int) -> List[int]:
+        """
+        Get the PIDs of the compute processes running on the specified GPU.
+
+        The processes are queried through NVML; nvidia-smi is only used as a fallback
+        when the driver does not support the NVML process query. Graphics processes
+        (e.g. the display server) are deliberately not included.
+
+        Args:
+            gpu_index (int): The index of the GPU to query.
+
+        Returns:
+            List[int]: The PIDs of the processes running on the GPU.
+        """
+        handle = self._handles[gpu_index]
+        try:
+            processes = pynvml.nvmlDeviceGetComputeRunningProcesses(handle)
+        except pynvml.NVMLError_NotSupported:
+            result = subprocess.run(['nvidia-smi', '--query-compute-apps=pid', '--format=csv,noheader,nounits', f'--id={gpu_index}'],
                                     capture_output=True, text=True, check=True)
-            pids = result.stdout.strip().split('\n')
-            for pid in pids:
-                if pid:
-                    try:
-                        process = psutil.Process(int(pid))
-                        if process.name() not in exempt_processes:
-                            process.terminate()
-                            print(f"Terminated process {pid} ({process.name()})")
-                        else:
-                            print(f"Skipped termination of exempt process {pid} ({process.name()})")
-                    except psutil.NoSuchProcess:
-                        print(f"Process {pid} not found")
-                    except psutil.AccessDenied:
-                        print(f"Permission denied to terminate process {pid}")
-        except subprocess.CalledProcessError as e:
-            print(f"Error querying NVIDIA SMI: {e}")
+            return [int(pid) for pid in result.stdout.strip().split('\n') if pid]
+        return [process.pid for process in processes]
 
     def _clear_gpu_cache(self, gpu_index: int):
         """
@@ -178,19 +646,16 @@ class GPUInfo(BaseModel):
         Args:
             gpu_index (int): The index of the GPU to clear cache for.
         """
-        if self.torch_available and self.torch_cuda_available:
+        if self.torch_cuda_available:
             import torch
-            if torch.cuda.is_available():
-                try:
+            try:
+                with torch.cuda.device(gpu_index):
                     torch.cuda.empty_cache()
                     print("Cleared CUDA cache")
-                    torch.cuda.device(gpu_index).empty_cache()
-                    torch.cuda.reset_peak_memory_stats(gpu_index)
-                    torch.cuda.reset_max_memory_allocated(gpu_index)
-                    torch.cuda.reset_max_memory_cached(gpu_index)
+                    torch.cuda.reset_peak_memory_stats()
                     print(f"Reset CUDA device {gpu_index}")
-                except RuntimeError as e:
-                    print(f"Error resetting CUDA device: {e}")
+            except RuntimeError as e:
+                print(f"Error resetting CUDA device: {e}")
         else:
             print("PyTorch or CUDA is not available. Unable to clear GPU cache.")
 
@@ -226,7 +691,17 @@ class GPUInfo(BaseModel):
         print("Note: Some processes may still be running if they were exempted, started by other users, or if you lack permissions to terminate them.")
         print("Please check 'nvidia-smi' to confirm the current state of the GPU.")
 
+def _require_numpy(method_name: str):
+    """
+    Raise an ImportError if NumPy, which the array-based accessors depend on, is not installed.
+
+    Args:
+        method_name (str): The name of the method requiring NumPy, used in the error message.
+    """
+    if np is None:
+        raise ImportError(f"NumPy is required for {method_name}. Install it with 'pip install gpuinfonv[numpy]'.")
+
 # Make DEFAULT_EXEMPT_PROCESSES available at the module level
-__all__ = ['GPUInfo', 'DEFAULT_EXEMPT_PROCESSES']
+__all__ = ['GPUInfo', 'DEFAULT_EXEMPT_PROCESSES', 'GPU_POLL_INTERVAL_SECONDS']
 
 
@@ -2,13 +2,17 @@
 This module defines the GPUStat class, which represents statistics for a single GPU.
 """
 
+from dataclasses import dataclass
 from typing import Optional
-from pydantic import BaseModel
 
-class GPUStat(BaseModel):
+@dataclass(slots=True)
+class GPUStat:
     """
     A class to represent statistics for a single GPU.
 
+    Memory, temperature and utilization values that the GPU cannot report
+    (e.g. on some MIG slices or vGPUs) are NaN; the optional fields are None instead.
+
     Attributes:
         index (int): The index of the GPU.
         name (str): The name of the GPU.
@@ -19,6 +23,10 @@ class GPUStat(BaseModel):
         gpu_utilization (float): GPU utilization as a percentage.
         memory_utilization (float): Memory utilization as a percentage.
         fan_speed (Optional[float]): Fan speed as a percentage, if available.
+        sm_clock (Optional[float]): Current SM clock in MHz, if available.
+        decoder_utilization (Optional[float]): Video decoder utilization as a percentage, if available.
+        encoder_utilization (Optional[float]): Video encoder utilization as a percentage, if available.
+        jpeg_utilization (Optional[float]): JPEG decoder utilization as a percentage, if available.
     """
     index: int
     name: str
@@ -28,4 +36,8 @@ class GPUStat(BaseModel):
     temperature: float  # in Celsius
     gpu_utilization: float  # in percentage
     memory_utilization: float  # in percentage
-    fan_speed: Optional[float] = None  # in percentage
\ No newline at end of file
+    fan_speed: Optional[float] = None  # in percentage
+    sm_clock: Optional[float] = None  # in MHz
+    decoder_utilization: Optional[float] = None  # in percentage
+    encoder_utilization: Optional[float] = None  # in percentage
+    jpeg_utilization: Optional[float] = None  # in percentage
\ No newline at end of file
@@ -0,0 +1,110 @@
+"""
+Test fixtures providing a stub pynvml module, so the tests run without NVIDIA GPUs or drivers.
+
+Each fake GPU is a dict of query results. A value of None makes the corresponding
+query raise NVMLError_NotSupported, and an exception instance is raised as is.
+"""
+
+import sys
+import types
+
+import pytest
+
+
+class NVMLError(Exception):
+    pass
+
+
+class NVMLError_NotSupported(NVMLError):
+    pass
+
+
+class NVMLError_NoPermission(NVMLError):
+    pass
+
+
+class NVMLError_FunctionNotFound(NVMLError):
+    pass
+
+
+# The fake GPUs, indexed by handle
+DEVICES = []
+
+
+def _make_device(**overrides) -> dict:
+    """
+    Create a fake GPU with plausible readings, overriding the given query results.
+    """
+    device = {
+        "name": b"Fake GPU",
+        "memory": (8 << 30, 2 << 30, 6 << 30),  # total, used, free in bytes
+        "clock": 1500,
+        "utilization": (40, 20),  # gpu, memory
+        "decoder": 5,
+        "encoder": 3,
+        "jpeg": 1,
+        "temperature": 55,
+        "fan": 30,
+    }
+    device.update(overrides)
+    return device
+
+
+def _query(handle, key):
+    value = DEVICES[handle][key]
+    if value is None:
+        raise NVMLError_NotSupported()
+    if isinstance(value, Exception):
+        raise value
+    return value
+
+
+def _memory_info(handle):
+    total, used, free = _query(handle, "memory")
+    return types.SimpleNamespace(total=total, used=used, free=free)
+
+
+def _utilization_rates(handle):
+    gpu, memory = _query(handle, "utilization")
+    return types.SimpleNamespace(gpu=gpu, memory=memory)
+
+
+pynvml = types.ModuleType("pynvml")
+pynvml.NVMLError = NVMLError
+pynvml.NVMLError_NotSupported = NVMLError_NotSupported
+pynvml.NVMLError_NoPermission = NVMLError_NoPermission
+pynvml.NVMLError_FunctionNotFound = NVMLError_FunctionNotFound
+pynvml.NVML_CLOCK_SM = 1
+pynvml.NVML_TEMPERATURE_GPU = 0
+pynvml.nvmlInit = lambda: None
+pynvml.nvmlShutdown = lambda: None
+pynvml.nvmlDeviceGetCount = lambda: len(DEVICES)
+pynvml.nvmlDeviceGetHandleByIndex = lambda index: index
+pynvml.nvmlDeviceGetName = lambda handle: _query(handle, "name")
+pynvml.nvmlDeviceGetMemoryInfo = _memory_info
+pynvml.nvmlDeviceGetClockInfo = lambda handle, clock_type: _query(handle, "clock")
+pynvml.nvmlDeviceGetUtilizationRates = _utilization_rates
+pynvml.nvmlDeviceGetDecoderUtilization = lambda handle: [_query(handle, "decoder"), 1000]
+pynvml.nvmlDeviceGetEncoderUtilization = lambda handle: [_query(handle, "encoder"), 1000]
+pynvml.nvmlDeviceGetJpgUtilization = lambda handle: [_query(handle, "jpeg"), 1000]
+pynvml.nvmlDeviceGetTemperature = lambda handle, sensor: _query(handle, "temperature")
+pynvml.nvmlDeviceGetFanSpeed = lambda handle: _query(handle, "fan")
+pynvml.nvmlDeviceGetComputeRunningProcesses = lambda handle: []
+sys.modules["pynvml"] = pynvml
+
+
+@pytest.fixture
+def devices():
+    """
+    The list of fake GPUs, emptied after each test.
+    """
+    yield DEVICES
+    DEVICES.clear()
+
+
+@pytest.fixture
+def make_device():
+    """
+    Factory for fake GPUs with plausible readings, see _make_device.
+    """
+    return _make_device
@@ -0,0 +1,419 @@
+"""
+Tests for GPUInfo, run against the stub pynvml from conftest.py.
+"""
+
+import gc
+import math
+import sys
+import types
+
+import psutil
+import pytest
+
+from gpuinfonv import GPUInfo
+from gpuinfonv import gpu_info
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """
+    A controllable replacement for time.monotonic as seen by gpu_info.
+    """
+    now = [1000.0]
+    monkeypatch.setattr(gpu_info, "time", types.SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+@pytest.fixture
+def host_processes(monkeypatch):
+    """
+    Fake host processes looked up through psutil.Process.
+
+    host_processes.names maps PIDs to process names, where a psutil exception class
+    makes the lookup raise it. The PIDs of terminated processes are collected in
+    host_processes.terminated.
+    """
+    names = {}
+    terminated = []
+
+    class FakeProcess:
+        def __init__(self, pid):
+            name = names.get(pid, psutil.NoSuchProcess)
+            if isinstance(name, type):
+                raise name(pid)
+            self.pid = pid
+            self._name = name
+
+        def name(self):
+            return self._name
+
+        def terminate(self):
+            terminated.append(self.pid)
+
+    monkeypatch.setattr(gpu_info.psutil, "Process", FakeProcess)
+    return types.SimpleNamespace(names=names, terminated=terminated)
+
+
+def count_calls(monkeypatch, name: str) -> list:
+    """
+    Record the handle of each call to the given stub pynvml function.
+    """
+    calls = []
+    query = getattr(gpu_info.pynvml, name)
+
+    def counted(handle, *args):
+        calls.append(handle)
+        return query(handle, *args)
+
+    monkeypatch.setattr(gpu_info.pynvml, name, counted)
+    return calls
+
+
+def test_out_of_range_samples_are_clamped(devices, make_device):
+    devices.append(make_device(utilization=(150, -5), temperature=200))
+
+    stat = GPUInfo().get_gpu_stats()[0]
+
+    assert stat.gpu_utilization == 100
+    assert stat.memory_utilization == 0
+    assert stat.temperature == 150
+
+
+def test_strict_util_reuses_previous_sample(devices, make_device):
+    devices.append(make_device(utilization=(40, 20)))
+    info = GPUInfo(strict_util=True)
+    assert info.get_gpu_stats()[0].gpu_utilization == 40
+
+    devices[0]["utilization"] = (150, 20)
+
+    assert info.get_gpu_stats()[0].gpu_utilization == 40
+
+
+def test_strict_util_clamps_without_previous_sample(devices, make_device):
+    devices.append(make_device(utilization=(150, 20)))
+
+    assert GPUInfo(strict_util=True).get_gpu_stats()[0].gpu_utilization == 100
+
+
+def test_unsupported_capabilities_are_skipped(devices, make_device):
+    devices.append(make_device(fan=None, clock=None, decoder=None, temperature=None, utilization=None))
+
+    stat = GPUInfo().get_gpu_stats()[0]
+
+    assert stat.fan_speed is None
+    assert stat.sm_clock is None
+    assert stat.decoder_utilization is None
+    assert math.isnan(stat.temperature)
+    assert math.isnan(stat.gpu_utilization)
+    assert math.isnan(stat.memory_utilization)
+    assert stat.used_memory == 2.0
+
+
+def test_transient_probe_error_keeps_capability(devices, make_device, monkeypatch):
+    device = make_device()
+    devices.append(device)
+    failures = iter([gpu_info.pynvml.NVMLError("transient")])
+
+    def fan_speed(handle):
+        error = next(failures, None)
+        if error is not None:
+            raise error
+        return device["fan"]
+
+    monkeypatch.setattr(gpu_info.pynvml, "nvmlDeviceGetFanSpeed", fan_speed)
+
+    assert GPUInfo().get_gpu_stats()[0].fan_speed == 30
+
+
+def test_persistent_probe_error_disables_optional_capability(devices, make_device):
+    devices.append(make_device(encoder=gpu_info.pynvml.NVMLError("persistent")))
+
+    info = GPUInfo()
+    stat = info.get_gpu_stats()[0]
+
+    assert info.gpu_count == 1
+    assert stat.encoder_utilization is None
+    assert stat.decoder_utilization == 5
+
+
+def test_persistent_probe_error_of_required_capability_fails_init(devices, make_device):
+    devices.append(make_device(temperature=gpu_info.pynvml.NVMLError("persistent")))
+
+    assert GPUInfo().gpu_count == 0
+
+
+def test_transient_clock_error_reports_none(devices, make_device):
+    devices.append(make_device())
+    info = GPUInfo()
+
+    devices[0]["clock"] = gpu_info.pynvml.NVMLError("transient")
+
+    assert info.get_gpu_stats()[0].sm_clock is None
+
+
+def test_transient_engine_utilization_errors_report_none(devices, make_device):
+    devices.append(make_device())
+    info = GPUInfo()
+
+    devices[0]["decoder"] = gpu_info.pynvml.NVMLError("transient")
+    devices[0]["encoder"] = gpu_info.pynvml.NVMLError("transient")
+    stat = info.get_gpu_stats()[0]
+
+    assert stat.decoder_utilization is None
+    assert stat.encoder_utilization is None
+    assert stat.jpeg_utilization == 1
+
+
+def test_transient_fan_error_reports_none(devices, make_device):
+    devices.append(make_device())
+    devices.append(make_device())
+    info = GPUInfo()
+
+    devices[1]["fan"] = gpu_info.pynvml.NVMLError("transient")
+    stats = info.get_gpu_stats()
+
+    assert stats[0].fan_speed == 30
+    assert stats[1].fan_speed is None
+
+
+def test_cached_stats_within_ttl(devices, make_device, clock):
+    devices.append(make_device())
+    info = GPUInfo()
+    first = info.get_gpu_stats_cached(ttl=1.0)
+
+    devices[0]["utilization"] = (90, 20)
+    clock[0] += 0.5
+
+    assert info.get_gpu_stats_cached(ttl=1.0) == first
+    assert info.gpus[0].gpu_utilization == 40
+
+
+def test_cached_stats_refresh_after_ttl(devices, make_device, clock):
+    devices.append(make_device())
+    info = GPUInfo()
+    info.get_gpu_stats_cached(ttl=1.0)
+
+    devices[0]["utilization"] = (90, 20)
+    clock[0] += 1.5
+
+    refreshed = info.get_gpu_stats_cached(ttl=1.0)
+    assert refreshed[0].gpu_utilization == 90
+
+
+def test_modifying_cached_stats_does_not_affect_cache(devices, make_device, clock):
+    devices.append(make_device())
+    info = GPUInfo()
+
+    info.get_gpu_stats().clear()
+    info.gpus.clear()
+
+    assert len(info.gpus) == 1
+
+
+@pytest.mark.parametrize("value, expected", [("2.5", 2.5), ("0", 0.0), ("fast", 1.0), ("-1", 1.0), ("nan", 1.0)])
+def test_read_poll_interval(monkeypatch, value, expected):
+    monkeypatch.setenv("GPU_POLL_INTERVAL_SECONDS", value)
+
+    assert gpu_info._read_poll_interval() == expected
+
+
+def test_read_poll_interval_unset(monkeypatch):
+    monkeypatch.delenv("GPU_POLL_INTERVAL_SECONDS", raising=False)
+
+    assert gpu_info._read_poll_interval(default=3.0) == 3.0
+
+
+def test_gpu_stats_soa(devices, make_device):
+    np = pytest.importorskip("numpy")
+    devices.append(make_device())
+    devices.append(make_device(fan=None, utilization=(60, 30)))
+
+    stats = GPUInfo().get_gpu_stats_soa()
+
+    assert set(stats) == set(gpu_info._DYNAMIC_FIELDS)
+    assert all(array.shape == (2,) and array.dtype == np.float32 for array in stats.values())
+    np.testing.assert_array_equal(stats["gpu_utilization"], [40, 60])
+    assert stats["fan_speed"][0] == 30
+    assert np.isnan(stats["fan_speed"][1])
+
+
+def test_gpu_stats_array(devices, make_device):
+    np = pytest.importorskip("numpy")
+    devices.append(make_device())
+    devices.append(make_device(fan=None, temperature=None))
+
+    stats = GPUInfo().get_gpu_stats_array()
+
+    assert stats.shape == (2,)
+    assert stats.dtype == gpu_info._GPU_DTYPE
+    np.testing.assert_array_equal(stats["index"], [0, 1])
+    np.testing.assert_array_equal(stats["total_memory"], [8.0, 8.0])
+    assert np.isnan(stats["fan_speed"][1])
+    assert np.isnan(stats["temperature"][1])
+    assert stats["temperature"][0] == 55
+
+
+def test_failed_init_leaves_no_gpus(devices, make_device):
+    devices.append(make_device())
+    devices.append(make_device(name=gpu_info.pynvml.NVMLError("init failure")))
+
+    info = GPUInfo()
+
+    assert info.gpu_count == 0
+    assert info.get_gpu_stats() == []
+    with pytest.raises(ValueError):
+        info.free_up_gpu(0)
+
+
+def test_reinitialization_discards_cached_stats(devices, make_device, clock):
+    devices.append(make_device())
+    info = GPUInfo()
+    assert len(info.get_gpu_stats_cached(ttl=1.0)) == 1
+
+    devices.append(make_device())
+    info.initialize_gpu_info()
+
+    assert info.gpu_count == 2
+    assert len(info.get_gpu_stats_cached(ttl=1.0)) == 2
+
+
+def test_array_accessors_match_handles_after_failed_init(devices, make_device):
+    pytest.importorskip("numpy")
+    devices.append(make_device(name=gpu_info.pynvml.NVMLError("init failure")))
+
+    info = GPUInfo()
+
+    assert info.gpu_count == 0
+    assert all(array.shape == (0,) for array in info.get_gpu_stats_soa().values())
+    assert info.get_gpu_stats_array().shape == (0,)
+
+
+def test_gpu_pids_from_nvml(devices, make_device, monkeypatch):
+    devices.append(make_device())
+    info = GPUInfo()
+    running = [types.SimpleNamespace(pid=101), types.SimpleNamespace(pid=102)]
+    monkeypatch.setattr(gpu_info.pynvml, "nvmlDeviceGetComputeRunningProcesses", lambda handle: running)
+
+    def nvidia_smi(*args, **kwargs):
+        raise AssertionError("nvidia-smi should not be called")
+
+    monkeypatch.setattr(gpu_info.subprocess, "run", nvidia_smi)
+
+    assert info._get_gpu_pids(0) == [101, 102]
+
+
+def test_gpu_pids_fall_back_to_nvidia_smi(devices, make_device, monkeypatch):
+    devices.append(make_device())
+    devices.append(make_device())
+    info = GPUInfo()
+    calls = []
+
+    def unsupported(handle):
+        raise gpu_info.pynvml.NVMLError_NotSupported()
+
+    def nvidia_smi(command, **kwargs):
+        calls.append(command)
+        return types.SimpleNamespace(stdout="201\n202\n")
+
+    monkeypatch.setattr(gpu_info.pynvml, "nvmlDeviceGetComputeRunningProcesses", unsupported)
+    monkeypatch.setattr(gpu_info.subprocess, "run", nvidia_smi)
+
+    assert info._get_gpu_pids(1) == [201, 202]
+    assert calls[0][0] == "nvidia-smi"
+    assert "--id=1" in calls[0]
+
+
+def test_exempt_processes_are_not_terminated(devices, make_device, host_processes, monkeypatch):
+    devices.append(make_device())
+    info = GPUInfo()
+    host_processes.names.update({101: "python", 102: "/usr/lib/xorg/Xorg", 103: "trainer"})
+    running = [types.SimpleNamespace(pid=pid) for pid in (101, 102, 103)]
+    monkeypatch.setattr(gpu_info.pynvml, "nvmlDeviceGetComputeRunningProcesses", lambda handle: running)
+
+    info._terminate_gpu_processes(0, ["/usr/lib/xorg/Xorg", "trainer"])
+
+    assert host_processes.terminated == [101]
+
+
+def test_terminate_looks_up_each_gpu_process_once(devices, make_device, host_processes, monkeypatch, capsys):
+    devices.append(make_device())
+    info = GPUInfo()
+    host_processes.names.update({101: "python", 102: psutil.AccessDenied})
+    running = [types.SimpleNamespace(pid=pid) for pid in (101, 101, 102, 103)]
+    monkeypatch.setattr(gpu_info.pynvml, "nvmlDeviceGetComputeRunningProcesses", lambda handle: running)
+
+    info._terminate_gpu_processes(0, [])
+
+    assert host_processes.terminated == [101]
+    output = capsys.readouterr().out
+    assert "Permission denied to terminate process 102" in output
+    assert "Process 103 not found" in output
+
+
+def test_torch_is_only_checked_on_first_access(devices, make_device, monkeypatch):
+    devices.append(make_device())
+    lookups = []
+    cuda_checks = []
+    torch = types.ModuleType("torch")
+    torch.cuda = types.SimpleNamespace(is_available=lambda: cuda_checks.append(True) or True)
+    monkeypatch.setitem(sys.modules, "torch", torch)
+    monkeypatch.setattr(gpu_info.importlib.util, "find_spec", lambda name: lookups.append(name) or object())
+
+    info = GPUInfo()
+    assert lookups == []
+    assert cuda_checks == []
+
+    assert info.torch_cuda_available
+    assert info.torch_cuda_available
+    assert lookups == ["torch"]
+    assert cuda_checks == [True]
+
+
+def test_construction_does_not_poll(devices, make_device, monkeypatch):
+    devices.append(make_device())
+    devices.append(make_device())
+    utilization_calls = count_calls(monkeypatch, "nvmlDeviceGetUtilizationRates")
+
+    GPUInfo()
+
+    # Only the capability probe queries each GPU
+    assert sorted(utilization_calls) == [0, 1]
+
+
+def test_probe_results_are_reused(devices, make_device, monkeypatch, clock):
+    devices.append(make_device())
+    devices.append(make_device(memory=(16 << 30, 4 << 30, 12 << 30)))
+    memory_calls = count_calls(monkeypatch, "nvmlDeviceGetMemoryInfo")
+    utilization_calls = count_calls(monkeypatch, "nvmlDeviceGetUtilizationRates")
+
+    info = GPUInfo()
+    assert sorted(memory_calls) == [0, 1]
+
+    clock[0] += 0.5
+    stats = info.get_gpu_stats_cached(ttl=1.0)
+
+    assert [stat.total_memory for stat in stats] == [8.0, 16.0]
+    assert [stat.used_memory for stat in stats] == [2.0, 4.0]
+    assert sorted(memory_calls) == [0, 1]
+    assert sorted(utilization_calls) == [0, 1]
+
+
+def test_thread_pool_is_reused_across_polls(devices, make_device, monkeypatch):
+    devices.extend(make_device() for _ in range(3))
+    executors = []
+
+    class RecordingExecutor(gpu_info.ThreadPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            executors.append(self)
+
+    monkeypatch.setattr(gpu_info, "ThreadPoolExecutor", RecordingExecutor)
+    info = GPUInfo()
+
+    assert [stat.index for stat in info.get_gpu_stats()] == [0, 1, 2]
+    assert [stat.index for stat in info.get_gpu_stats()] == [0, 1, 2]
+    assert len(executors) == 1
+
+    del info
+    gc.collect()
+    assert executors[0]._shutdown